@@ -1,22 +1,126 @@
 """Terminal User Interface for the anime/manga recommendation system."""
 
-from typing import List, Dict, Tuple, Optional
-from rich.console import Console
+from typing import Any, Callable, Iterable, List, Dict, Tuple, Optional
+from bisect import bisect_left
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
+from rich.measure import Measurement
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.align import Align
 from rich.text import Text
 from rich import box
-from rich.prompt import Prompt
+from rich.control import Control
+from rich.region import Region
+from rich.segment import ControlType, Segment
 
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit import prompt
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.document import Document
+from prompt_toolkit import PromptSession
 
 from engine.recommender import Recommender
 from db.mongo import get_all_titles
+from db.title_cache import load_cached_titles, save_cached_titles
 
+
+def enable_vt_mode() -> None:
+    """Turn on ANSI escape processing for the Windows console.
+
+    Without it Rich runs in legacy Windows mode, issuing a Win32 call per
+    styled segment instead of one buffered write per frame, and cannot use
+    the alternate screen. Does nothing on other platforms.
+    """
+    if sys.platform != "win32":
+        return
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
+
+# Must run before the Console is created, which detects legacy mode once
+enable_vt_mode()
 console = Console(force_terminal=True)
 
+# Rows kept free below the frame for prompts and messages
+PROMPT_ROWS = 3
+
+# Recommender queries run here so the UI can show a spinner meanwhile
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+class TitleCompleter(Completer):
+    """Prefix completer backed by a sorted, lower-cased title index.
+
+    A keystroke costs a binary search plus the matches yielded, instead of
+    a scan over every title like WordCompleter. Completion starts after
+    ``min_prefix`` characters and yields at most ``max_completions`` titles.
+    """
+
+    min_prefix = 2
+    max_completions = 50
+
+    def __init__(self, titles: Iterable[str] = ()) -> None:
+        self.set_titles(titles)
+
+    def set_titles(self, titles: Iterable[str]) -> None:
+        """Replace the indexed titles."""
+        pairs = sorted((title.lower(), title) for title in titles)
+        # Swap both lists in one assignment so readers never see a mix
+        self._index = ([lower for lower, _ in pairs], [title for _, title in pairs])
+
+    def get_completions(self, document: Document, complete_event) -> Iterable[Completion]:
+        """Yield titles starting with the text before the cursor."""
+        text = document.text_before_cursor
+        if len(text) < self.min_prefix:
+            return
+
+        prefix = text.lower()
+        lowered, titles = self._index
+
+        start = bisect_left(lowered, prefix)
+        for i in range(start, min(start + self.max_completions, len(lowered))):
+            if not lowered[i].startswith(prefix):
+                break
+            yield Completion(titles[i], start_position=-len(text))
+
+
+class PrerenderedPanel:
+    """Wrap a static renderable and replay its rendered segments.
+
+    The wrapped panel is laid out once per available width; later redraws
+    at the same width reuse the cached lines instead of parsing markup and
+    laying out the panel again.
+    """
+
+    def __init__(self, renderable: RenderableType) -> None:
+        self.renderable = renderable
+        self._width: Optional[int] = None
+        self._lines: List[List[Segment]] = []
+        self._measured_width: Optional[int] = None
+        self._measurement: Optional[Measurement] = None
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if options.max_width != self._width:
+            self._lines = console.render_lines(self.renderable, options.update(height=None), pad=False)
+            self._width = options.max_width
+
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        if options.max_width != self._measured_width:
+            self._measurement = Measurement.get(console, options, self.renderable)
+            self._measured_width = options.max_width
+        return self._measurement
+
 
 def create_header() -> Panel:
     """Create the application header panel."""
@@ -36,11 +140,17 @@ def create_menu_panel() -> Panel:
     return Panel(content, title="Menu", box=box.ROUNDED)
 
 
-def create_result_card(doc: Dict) -> Panel:
+def create_result_card(doc: Dict) -> PrerenderedPanel:
     """Create a result card for a single document."""
-    title = doc.get("title_romaji") or doc.get("title_english", "Unknown Title")
-    description = (doc.get("description") or "")[:140]
-    return Panel(f"[bold magenta]{title}[/]\n{description}", box=box.ROUNDED)
+    title = doc.get("title_romaji") or doc.get("title_english") or "Unknown Title"
+    description = doc["_desc_short"]
+
+    # Assemble styled text directly rather than parsing markup
+    body = Text()
+    body.append(title, style="bold magenta")
+    body.append("\n")
+    body.append(description)
+    return PrerenderedPanel(Panel(body, box=box.ROUNDED))
 
 
 def create_results_panel(results: List[Tuple[float, Dict]]) -> Panel:
@@ -49,30 +159,116 @@ def create_results_panel(results: List[Tuple[float, Dict]]) -> Panel:
         return Panel("No results found. Try a different query.", title="Results", box=box.ROUNDED)
 
     cards = [create_result_card(doc) for _, doc in results]
-    return Panel(Columns(cards, equal=True), title="Results", box=box.ROUNDED)
+    # A fixed card width lets Columns skip searching for a column count
+    # that fits, and keeps every redraw at the width the cards cached
+    card_width = max(console.size.width // 4 - 2, 20)
+    return Panel(Columns(cards, width=card_width, expand=True), title="Results", box=box.ROUNDED)
+
 
+def draw_frame(frame: Group) -> None:
+    """Repaint the frame in place on the alternate screen.
 
-def handle_text_search(engine: Recommender) -> List[Tuple[float, Dict]]:
+    Lines are overwritten at fixed positions instead of clearing the
+    terminal, and the cursor is left on the prompt rows below the frame.
+    """
+    width, height = console.size
+    frame_height = max(height - PROMPT_ROWS, 1)
+    with console:  # buffer the whole frame into one terminal write
+        console.update_screen(frame, region=Region(0, 0, width, frame_height))
+        clear_prompt_rows()
+
+
+def clear_prompt_rows() -> None:
+    """Erase the prompt rows below the frame and park the cursor on the first.
+
+    Used on its own to re-prompt without repainting the frame, so earlier
+    prompts and messages never pile up and scroll the frame off screen.
+    """
+    height = console.size.height
+    frame_height = max(height - PROMPT_ROWS, 1)
+    for row in range(frame_height, height):
+        console.control(Control.move_to(0, row), Control((ControlType.ERASE_IN_LINE, 2)))
+    console.control(Control.move_to(0, frame_height))
+
+
+def run_search(search: Callable[..., Any], *args: Any) -> List[Tuple[float, Dict]]:
+    """Run a recommender query on a worker thread behind a spinner.
+
+    Exceptions raised by the query are re-raised in the caller.
+    """
+    future = EXECUTOR.submit(search, *args)
+    with console.status("Searching..."):
+        results = list(future.result())
+
+    # Truncate each description once per document rather than per card
+    for _, doc in results:
+        if "_desc_short" not in doc:
+            doc["_desc_short"] = (doc.get("description") or "")[:140]
+    return results
+
+
+@lru_cache(maxsize=128)
+def cached_search(engine: Recommender, search_type: str, query: str, n: int) -> Tuple[Tuple[float, Dict], ...]:
+    """Run a text or title query, memoizing results for repeated queries."""
+    search = engine.by_text if search_type == "text" else engine.by_title
+    return tuple(search(query, n))
+
+
+def handle_text_search(engine: Recommender, session: PromptSession) -> List[Tuple[float, Dict]]:
     """Handle text-based search input."""
     try:
-        query = Prompt.ask("Describe what you want").strip()
+        query = session.prompt("Describe what you want: ").strip()
         if not query:
             console.print("[yellow]Please enter a description.[/yellow]")
             return []
-        return engine.by_text(query, 8)
+        return run_search(cached_search, engine, "text", query, 8)
     except Exception as e:
         console.print(f"[red]Error during search: {e}[/red]")
         return []
 
 
-def handle_title_search(engine: Recommender, completer: WordCompleter) -> List[Tuple[float, Dict]]:
-    """Handle title-based search input."""
+def load_titles(completer: TitleCompleter, loaded: threading.Event, errors: List[str]) -> None:
+    """Load all titles and hand them to the completer.
+
+    Titles come from the local disk cache when it is fresh, otherwise from
+    MongoDB. Runs on a background thread so the UI is usable meanwhile;
+    a failure is appended to ``errors`` for the main loop to show, since
+    printing here would corrupt an active prompt.
+    """
     try:
-        title = prompt("Start typing title: ", completer=completer).strip()
+        completer.set_titles(load_cached_titles() or save_cached_titles(get_all_titles()))
+    except Exception as e:
+        errors.append(f"[red]Failed to load titles: {e}[/red]")
+    finally:
+        loaded.set()
+
+
+def warm_up(engine: Recommender) -> None:
+    """Run a throwaway query so the first real search skips model warm-up."""
+    try:
+        engine.by_text("warmup", 1)
+    except Exception:
+        pass  # a failed warm-up just means the first query pays the cost
+
+
+def handle_title_search(engine: Recommender, session: PromptSession,
+                        titles_loaded: threading.Event) -> Optional[List[Tuple[float, Dict]]]:
+    """Handle title-based search input.
+
+    Returns None when the titles are still loading, so the caller keeps the
+    current results on screen and re-prompts below the message.
+    """
+    if not titles_loaded.is_set():
+        clear_prompt_rows()
+        console.print("[yellow]Titles are still loading, please try again in a moment.[/yellow]")
+        return None
+
+    try:
+        title = session.prompt("Start typing title: ").strip()
         if not title:
             console.print("[yellow]Please enter a title.[/yellow]")
             return []
-        return engine.by_title(title, 8)
+        return run_search(cached_search, engine, "title", title, 8)
     except ValueError as e:
         console.print(f"[red]{e}[/red]")
         return []
@@ -85,36 +281,59 @@ def main() -> None:
     """Main application loop."""
     try:
         engine = Recommender()
-        titles = get_all_titles()
-        completer = WordCompleter(titles, ignore_case=True)
+        threading.Thread(target=warm_up, args=(engine,), daemon=True).start()
 
-        results = None
+        # Populate the completer in the background so the UI is usable
+        # while the titles load
+        completer = TitleCompleter()
+        titles_loaded = threading.Event()
+        title_errors: List[str] = []
+        threading.Thread(
+            target=load_titles, args=(completer, titles_loaded, title_errors), daemon=True
+        ).start()
 
-        while True:
-            console.clear()
-            console.print(create_header())
+        # All input goes through prompt_toolkit; each session builds its
+        # application once and reuses it for every prompt
+        menu_session = PromptSession()
+        text_session = PromptSession()
+        title_session = PromptSession(completer=completer)
 
-            layout = Columns(
-                [
-                    create_menu_panel(),
-                    create_results_panel(results),
-                ],
-                expand=True,
-            )
+        # Header and menu never change, so build them once; the results
+        # panel (and its cards) is rebuilt only when a new query returns
+        header = create_header()
+        menu = create_menu_panel()
+        results_panel = create_results_panel(None)
 
-            console.print(layout)
+        # Only redraw when something on screen changed; an invalid option
+        # just clears the prompt rows and re-prompts below the current frame
+        dirty = True
 
-            choice = Prompt.ask("\nChoose option").lower().strip()
+        with console.screen(hide_cursor=False):
+            while True:
+                if dirty:
+                    layout = Columns([menu, results_panel], expand=True)
+                    draw_frame(Group(header, layout))
+                    dirty = False
 
-            if choice == "1":
-                results = handle_text_search(engine)
-            elif choice == "2":
-                results = handle_title_search(engine, completer)
-            elif choice == "q":
-                break
-            else:
-                console.print("[yellow]Invalid option. Please choose 1, 2, or Q.[/yellow]")
-                continue
+                    # Show background errors on the prompt rows of a fresh frame
+                    while title_errors:
+                        console.print(title_errors.pop(0))
+
+                choice = menu_session.prompt("Choose option: ").lower().strip()
+
+                if choice == "1":
+                    results_panel = create_results_panel(handle_text_search(engine, text_session))
+                    dirty = True
+                elif choice == "2":
+                    results = handle_title_search(engine, title_session, titles_loaded)
+                    if results is not None:
+                        results_panel = create_results_panel(results)
+                        dirty = True
+                elif choice == "q":
+                    break
+                else:
+                    clear_prompt_rows()
+                    console.print("[yellow]Invalid option. Please choose 1, 2, or Q.[/yellow]")
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Application interrupted by user.[/yellow]")
@@ -1,12 +1,19 @@
 """Modern Terminal Dashboard for Anime & Manga AI Recommender."""
 
-from typing import List, Dict, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Callable, List, Dict, Tuple, Optional, Any, Sequence
 from enum import Enum
 from dataclasses import dataclass
 import time
 import threading
+import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import heapq
+from bisect import bisect_left, bisect_right
 import sys
-import msvcrt
+import os
+import codecs
+import selectors
 from contextlib import contextmanager
 
 from rich.console import Console
@@ -22,19 +29,14 @@ from rich import box
 from rich.prompt import Prompt
 from rich.status import Status
 
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.application import Application
-from prompt_toolkit.layout import Layout as PTLayout
-from prompt_toolkit.layout.containers import HSplit, VSplit
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.widgets import TextArea
-
-from engine.recommender import Recommender
-from db.mongo import get_all_titles, get_collection
 import config
 
+# The engine (faiss, sentence-transformers), pymongo and prompt_toolkit are
+# imported where they are first used so the dashboard can paint quickly
+if TYPE_CHECKING:
+    from engine.recommender import Recommender
+    from prompt_toolkit.completion import WordCompleter
+
 
 class ViewState(Enum):
     """Dashboard view states."""
@@ -45,7 +47,7 @@ class ViewState(Enum):
     HELP = "help"
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Application state container."""
     current_view: ViewState = ViewState.DASHBOARD  # Start with dashboard
@@ -67,15 +69,206 @@ class AppState:
     db_status: str = "Connecting..."
 
 
+def _styled_text(parts: Sequence[Tuple[str, Optional[str]]]) -> Text:
+    """Build a Text from (string, style) parts.
+
+    The strings are joined once and each styled part becomes a single span,
+    instead of growing the Text with one append per part.
+    """
+    text = Text("".join(part for part, _ in parts))
+    offset = 0
+    for part, style in parts:
+        end = offset + len(part)
+        if style:
+            text.stylize(style, offset, end)
+        offset = end
+    return text
+
+
+class KeyReader:
+    """Cross-platform single key press reader.
+
+    Uses msvcrt on Windows; elsewhere puts the terminal in cbreak mode and
+    waits on stdin with a selector (epoll/kqueue where available). Arrow
+    keys are reported as "up", "down", "left" and "right", Enter as "\r".
+    Use as a context manager so the terminal mode is restored on exit.
+    """
+
+    _WINDOWS_ARROWS = {"H": "up", "P": "down", "K": "left", "M": "right"}
+    _ANSI_ARROWS = {"A": "up", "B": "down", "C": "right", "D": "left"}
+
+    def __init__(self) -> None:
+        self._windows = sys.platform == "win32"
+        self._saved_mode: Optional[list] = None
+        if not self._windows:
+            self._fd = sys.stdin.fileno()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    def __enter__(self) -> "KeyReader":
+        if not self._windows and os.isatty(self._fd):
+            import termios
+            import tty
+            self._saved_mode = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._saved_mode is not None:
+            import termios
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+
+    def read(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for a key press.
+
+        Args:
+            timeout: Seconds to wait, or None to block until a key arrives.
+
+        Returns:
+            Optional[str]: The key, or None on timeout or an unrecognised key.
+
+        Raises:
+            EOFError: If stdin is closed.
+        """
+        if self._windows:
+            return self._read_windows(timeout)
+        return self._read_posix(timeout)
+
+    def _read_windows(self, timeout: Optional[float]) -> Optional[str]:
+        import msvcrt
+        if timeout is not None:
+            # msvcrt has no readiness wait, so poll until the deadline
+            deadline = time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.01)
+
+        key = msvcrt.getwch()
+        if key in ("\x00", "\xe0"):  # Special key prefix
+            return self._WINDOWS_ARROWS.get(msvcrt.getwch())
+        return key
+
+    def _read_char(self, timeout: Optional[float]) -> Optional[str]:
+        """Read one character from stdin, or None if none arrives in time."""
+        while True:
+            if not self._selector.select(timeout):
+                return None
+            data = os.read(self._fd, 1)
+            if not data:
+                raise EOFError("stdin closed")
+            char = self._decoder.decode(data)
+            if char:
+                return char
+            # Partial multi-byte character; its remaining bytes follow
+
+    def _read_posix(self, timeout: Optional[float]) -> Optional[str]:
+        key = self._read_char(timeout)
+        if key == "\x1b":
+            # Arrow keys arrive as ESC [ A..D; a lone ESC is the Escape key
+            follow = self._read_char(0.05)
+            if follow is None:
+                return "\x1b"
+            if follow == "O":  # SS3 sequences carry a single final character
+                return self._ANSI_ARROWS.get(self._read_char(0.05) or "")
+            if follow == "[":
+                # CSI sequences such as Delete (ESC [ 3 ~) carry parameter
+                # bytes before the final byte; consume the whole sequence so
+                # none of it leaks into the input, and map only plain arrows
+                sequence = ""
+                while True:
+                    char = self._read_char(0.05)
+                    if char is None:
+                        return None
+                    sequence += char
+                    if "\x40" <= char <= "\x7e":
+                        break
+                return self._ANSI_ARROWS.get(sequence)
+            return None
+        if key == "\n":  # cbreak mode translates Enter to newline
+            return "\r"
+        return key
+
+
 class DashboardUI:
     """Modern terminal dashboard for the recommendation system."""
 
+    # Substring matches collected before ranking them by length
+    SUBSTRING_MATCH_LIMIT = 200
+
+    HELP_SHORTCUTS = (
+        ("d", "Dashboard"),
+        ("t", "Text Search"),
+        ("s", "Title Search"),
+        ("↑/↓", "Navigate Results/Matches"),
+        ("m", "Find More Similar (Results)"),
+        ("Enter", "Select Item/Details"),
+        ("h", "Help"),
+        ("q", "Quit"),
+        ("Esc", "Back/Cancel"),
+    )
+
+    FOOTER_HINTS = {
+        ViewState.DASHBOARD: "[t] Text Search | [s] Title Search | [h] Help | [q] Quit",
+        ViewState.SEARCH_TEXT: "[Type to search] [Enter] Submit | [Esc] Cancel",
+        ViewState.SEARCH_TITLE: "[Type to search] [↑↓] Navigate matches | [Enter] Select | [Esc] Cancel",
+        ViewState.RESULTS: "[↑↓] Navigate | [m] More similar | [d] Dashboard | [q] Quit",
+        ViewState.HELP: "[d] Dashboard | [q] Quit",
+    }
+
     def __init__(self):
         self.console = Console(force_terminal=True)
         self.state = AppState()
-        self.engine: Optional[Recommender] = None
+        self.engine: Optional["Recommender"] = None
         self.titles: List[str] = []
-        self.completer: Optional[WordCompleter] = None
+        self._titles_folded: List[str] = []
+        self._title_lengths: List[int] = []
+        # Case-folded titles as UTF-8 joined by newlines, and the byte offset
+        # where each title starts (plus a final sentinel), for substring search
+        self._titles_blob = b""
+        self._title_starts: List[int] = [0]
+        # Title match indices per search input: a range for prefix matches,
+        # a list for substring matches
+        self._match_cache: Dict[str, Sequence[int]] = {}
+        self.completer: Optional["WordCompleter"] = None
+        self._dirty = False  # layout needs rebuilding
+        self._key_q: "queue.Queue[str]" = queue.Queue()
+        # Keys typed while a search is pending, replayed once it finishes
+        self._held_keys: "deque[str]" = deque()
+
+        # Searches run off the UI thread; the main loop polls the future
+        self._search_executor = ThreadPoolExecutor(max_workers=1)
+        self._search_future: Optional[Future] = None
+        self._loading_panel = Panel(Spinner("dots", text="Searching..."), title="Search", box=box.ROUNDED)
+        # Engine and titles load on the same worker after the first paint
+        self._init_future: Optional[Future] = None
+
+        # Panels keyed by the state they depend on; the status bar changes
+        # every second so it keeps only its latest (key, panel) pair
+        self._panel_cache: Dict[Tuple, Panel] = {}
+        self._status_bar_cache: Tuple[Optional[Tuple], Optional[Panel]] = (None, None)
+        # Clock text for the status bar, reformatted once per second
+        self._clock: Tuple[int, str] = (0, "")
+
+        # Help and footers never change, so they are built up front
+        self._help_panel = self._build_help_view()
+        self._footers = {view: self._build_footer(hint) for view, hint in self.FOOTER_HINTS.items()}
+        self._default_footer = self._build_footer("[q] Quit")
+
+        # The layout tree is built once; each frame only swaps the panels
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="header", size=5),
+            Layout(name="main", ratio=1),
+            Layout(name="footer", size=3)
+        )
+        self._results_layout = Layout()
+        self._results_layout.split_row(
+            Layout(name="results", ratio=2),
+            Layout(name="detail", ratio=1)
+        )
 
         # Initialize components
         self._initialize_app()
@@ -83,27 +276,92 @@ class DashboardUI:
     def _initialize_app(self) -> None:
         """Initialize application components."""
         try:
+            from db.mongo import get_collection
+
             # Initialize database connection and get stats
             collection = get_collection()
-            self.state.total_titles = collection.count_documents({})
+            # Read from collection metadata rather than scanning every document
+            self.state.total_titles = collection.estimated_document_count()
             self.state.db_status = f"Connected ({self.state.total_titles} titles)"
 
-            # Initialize recommendation engine
+            # Load the engine and titles in the background so the dashboard
+            # can render immediately; _poll_init installs them
             self.state.engine_status = "Loading engine..."
-            self.engine = Recommender()
+            self._init_future = self._search_executor.submit(self._load_engine)
+
+        except Exception as e:
+            self.state.error_message = f"Initialization failed: {e}"
+            self.state.db_status = "Failed"
+            self.state.engine_status = "Failed"
+
+    def _load_engine(self) -> Tuple["Recommender", Tuple[str, ...]]:
+        """Load the recommendation engine and autocomplete titles."""
+        from engine.recommender import Recommender
+        from db.mongo import get_all_titles
+
+        return Recommender(), get_all_titles()
+
+    def _poll_init(self) -> None:
+        """Install the engine and titles once background loading has finished."""
+        future = self._init_future
+        if future is None or not future.done():
+            return
+
+        self._init_future = None
+        self._dirty = True
+
+        try:
+            self.engine, titles = future.result()
             self.state.engine_status = "Ready"
 
             # Load titles for autocomplete
-            self.titles = get_all_titles()
+            self._set_titles(titles)
+            from prompt_toolkit.completion import WordCompleter
+
             self.completer = WordCompleter(self.titles, ignore_case=True)
 
         except Exception as e:
             self.state.error_message = f"Initialization failed: {e}"
-            self.state.db_status = "Failed"
             self.state.engine_status = "Failed"
 
+    def _set_titles(self, titles: Sequence[str]) -> None:
+        """Index titles for autocomplete matching."""
+        # Keep titles sorted by their case-folded form so prefix matches
+        # form a contiguous range that can be found by binary search
+        pairs = sorted((title.casefold(), title) for title in titles)
+        self._titles_folded = [folded for folded, _ in pairs]
+        self.titles = [title for _, title in pairs]
+        self._title_lengths = [len(folded) for folded in self._titles_folded]
+
+        # One contiguous buffer lets bytes.find scan every title in C. UTF-8
+        # keeps mostly-ASCII titles at one byte per character, where a str
+        # would widen to four bytes for all titles if any held an emoji
+        encoded = [title.encode("utf-8") for title in self._titles_folded]
+        self._titles_blob = b"\n".join(encoded)
+        starts = []
+        offset = 0
+        for title in encoded:
+            starts.append(offset)
+            offset += len(title) + 1
+        starts.append(offset)  # sentinel: start of the title after the last
+        self._title_starts = starts
+
+        self._match_cache.clear()
+
+    def _cached_panel(self, key: Tuple, build: Callable[[], Panel]) -> Panel:
+        """Return the panel cached under key, building it on first use."""
+        panel = self._panel_cache.get(key)
+        if panel is None:
+            panel = self._panel_cache[key] = build()
+        return panel
+
     def _create_header(self) -> Panel:
         """Create application header with title and status."""
+        key = ("header", self.state.db_status, self.state.engine_status)
+        return self._cached_panel(key, self._build_header)
+
+    def _build_header(self) -> Panel:
+        """Build the header panel."""
         header_text = Text()
         header_text.append("🎌 Anime & Manga AI Recommender\n", style="bold cyan")
         header_text.append(f"v1.0 | {self.state.db_status} | {self.state.engine_status}", style="dim cyan")
@@ -112,68 +370,54 @@ class DashboardUI:
 
     def _create_dashboard_view(self) -> Panel:
         """Create main dashboard view with key metrics."""
-        # Create table content as Rich Text object
-        table_text = Text()
-        table_text.append("Metric                    Value                    Status\n", style="bold magenta")
-        table_text.append("─" * 60 + "\n")
-        table_text.append(f"Total Titles            {self.state.total_titles:,}                    ✅\n")
-        table_text.append(f"Engine Status           {self.state.engine_status}                    {'✅' if self.engine else '❌'}\n")
-        table_text.append(f"Database                {self.state.db_status}                    {'✅' if 'Connected' in self.state.db_status else '❌'}\n")
-        table_text.append(f"Search Types            Text & Title              ✅\n")
-
-        welcome_text = Text("\nWelcome to the AI Recommendation System!\n\n")
-        welcome_text.append("Use the keyboard shortcuts below to navigate.\n")
-        welcome_text.append("Press 'h' for detailed help.", style="dim")
-
-        # Combine texts
-        combined_text = Text()
-        combined_text.append(table_text)
-        combined_text.append(welcome_text)
-
-        return Panel(combined_text, title="Dashboard", box=box.ROUNDED)
+        key = ("dashboard", self.state.total_titles, self.state.engine_status,
+               self.engine is not None, self.state.db_status)
+        return self._cached_panel(key, self._build_dashboard_view)
+
+    def _build_dashboard_view(self) -> Panel:
+        """Build the dashboard panel."""
+        engine_ok = '✅' if self.engine else '❌'
+        db_ok = '✅' if 'Connected' in self.state.db_status else '❌'
+        return Panel(_styled_text([
+            ("Metric                    Value                    Status\n", "bold magenta"),
+            ("─" * 60 + "\n"
+             f"Total Titles            {self.state.total_titles:,}                    ✅\n"
+             f"Engine Status           {self.state.engine_status}                    {engine_ok}\n"
+             f"Database                {self.state.db_status}                    {db_ok}\n"
+             "Search Types            Text & Title              ✅\n"
+             "\nWelcome to the AI Recommendation System!\n\n"
+             "Use the keyboard shortcuts below to navigate.\n", None),
+            ("Press 'h' for detailed help.", "dim"),
+        ]), title="Dashboard", box=box.ROUNDED)
 
     def _create_search_view(self) -> Panel:
         """Create search input view."""
         if self.state.current_view == ViewState.SEARCH_TEXT:
             prompt_text = "Describe what you want to watch:"
             placeholder = "e.g., 'action-packed adventure with magic'"
-
-            input_display = self.state.search_input_buffer
-            if not input_display:
-                input_display = placeholder
-                is_placeholder = True
-            else:
-                is_placeholder = False
-
-            content = Text()
-            content.append(f"{prompt_text}\n\n", style="bold cyan")
-            if is_placeholder:
-                content.append(f"{input_display}\n\n", style="dim white on blue")
-            else:
-                content.append(f"{input_display}\n\n", style="white on blue")
-            content.append("Type to search, Enter to submit, Esc to cancel", style="dim")
-
         else:  # SEARCH_TITLE
             prompt_text = "Start typing a title:"
             placeholder = "e.g., 'Attack on Titan'"
 
-            input_display = self.state.search_input_buffer
-            if not input_display:
-                input_display = placeholder
-                is_placeholder = True
-            else:
-                is_placeholder = False
-
-            content = Text()
-            content.append(f"{prompt_text}\n\n", style="bold cyan")
-            if is_placeholder:
-                content.append(f"{input_display}\n\n", style="dim white on blue")
-            else:
-                content.append(f"{input_display}\n\n", style="white on blue")
+        input_display = self.state.search_input_buffer
+        if not input_display:
+            input_display = placeholder
+            input_style = "dim white on blue"
+        else:
+            input_style = "white on blue"
+
+        # Collect (text, style) parts and build the Text in one go
+        parts: List[Tuple[str, Optional[str]]] = [
+            (f"{prompt_text}\n\n", "bold cyan"),
+            (f"{input_display}\n\n", input_style),
+        ]
 
+        if self.state.current_view == ViewState.SEARCH_TEXT:
+            parts.append(("Type to search, Enter to submit, Esc to cancel", "dim"))
+        else:
             # Show matching titles if we have input
             if self.state.search_input_buffer and self.state.title_matches:
-                content.append("\nMatching titles:\n", style="bold yellow")
+                parts.append(("\nMatching titles:\n", "bold yellow"))
 
                 # Show up to 10 matches
                 start_idx = max(0, self.state.selected_title_index - 5)
@@ -182,63 +426,16 @@ class DashboardUI:
                 for i in range(start_idx, end_idx):
                     title = self.state.title_matches[i]
                     if i == self.state.selected_title_index:
-                        content.append(f"▶ {title}\n", style="bold white on blue")
+                        parts.append((f"▶ {title}\n", "bold white on blue"))
                     else:
-                        content.append(f"  {title}\n", style="dim white")
+                        parts.append((f"  {title}\n", "dim white"))
 
                 if len(self.state.title_matches) > 10:
-                    content.append(f"\n... and {len(self.state.title_matches) - 10} more matches", style="dim")
-
-            content.append("\nType to search, ↑↓ to navigate, Enter to select, Esc to cancel", style="dim")
-
-        return Panel(content, title="Search", box=box.ROUNDED)
-
-    def _create_results_view(self) -> Panel:
-        """Create results list view."""
-        if not self.state.search_results:
-            return Panel("No results found", title="Results", box=box.ROUNDED)
-
-        # Create table for results
-        table = Table(box=box.SIMPLE, show_header=True)
-        table.add_column("Title", style="bold cyan", no_wrap=True)
-        table.add_column("Type", style="magenta")
-        table.add_column("Score", style="green", justify="right")
-
-        for i, (score, item) in enumerate(self.state.search_results):
-            if not item:
-                continue
-
-            title = item.get("title_romaji") or item.get("title_english") or "Unknown"
-            item_type = item.get("type", "Unknown")
-            display_score = ".3f"
-
-            if i == self.state.selected_result:
-                table.add_row(f"▶ {title}", item_type, display_score, style="bold white on blue")
-            else:
-                table.add_row(title, item_type, display_score)
-
-        return Panel(table, title="Results", box=box.ROUNDED)
-
-    def _create_detail_view(self) -> Panel:
-        """Create detail view for selected result."""
-        if not self.state.search_results or self.state.selected_result >= len(self.state.search_results):
-            return Panel("No selection", title="Details", box=box.ROUNDED)
+                    parts.append((f"\n... and {len(self.state.title_matches) - 10} more matches", "dim"))
 
-        score, item = self.state.search_results[self.state.selected_result]
-
-        details = Text()
-        details.append(f"Title: {item.get('title_romaji') or item.get('title_english') or 'Unknown'}\n", style="bold cyan")
-        details.append(f"Type: {item.get('type', 'Unknown')}\n", style="magenta")
-        details.append(f"Score: {score:.3f}\n\n", style="green")
+            parts.append(("\nType to search, ↑↓ to navigate, Enter to select, Esc to cancel", "dim"))
 
-        if item.get("genres"):
-            details.append(f"Genres: {', '.join(item['genres'])}\n", style="yellow")
-
-        if item.get("description"):
-            desc = item["description"][:200] + "..." if len(item["description"]) > 200 else item["description"]
-            details.append(f"\nDescription: {desc}", style="dim")
-
-        return Panel(details, title="Details", box=box.ROUNDED)
+        return Panel(_styled_text(parts), title="Search", box=box.ROUNDED)
 
     def _update_title_matches(self) -> None:
         """Update the list of matching titles based on current input buffer."""
@@ -247,21 +444,60 @@ class DashboardUI:
             self.state.selected_title_index = 0
             return
 
-        # Find titles that start with the input (case insensitive)
-        query = self.state.search_input_buffer.lower()
-        matches = [title for title in self.titles if title.lower().startswith(query)]
+        query = self.state.search_input_buffer.casefold()
 
-        # If no exact starts, find titles that contain the input
-        if not matches:
-            matches = [title for title in self.titles if query in title.lower()]
-
-        # Sort by relevance (exact matches first, then by length)
-        matches.sort(key=lambda x: (not x.lower().startswith(query), len(x)))
-
-        # Limit to reasonable number
-        self.state.title_matches = matches[:50]  # Show up to 50 matches
+        # Shortest matches first, limited to a reasonable number. Matches are
+        # either all prefix or all substring matches, so length alone orders them
+        match_idx = heapq.nsmallest(50, self._find_title_matches(query), key=self._title_lengths.__getitem__)
+        self.state.title_matches = [self.titles[i] for i in match_idx]
         self.state.selected_title_index = 0
 
+    def _find_title_matches(self, query: str) -> Sequence[int]:
+        """Return indices of titles matching a case-folded query.
+
+        Typing extends the query one character at a time, so the matches of
+        ``query[:-1]`` (when cached) narrow the search for ``query``.
+        """
+        cached = self._match_cache.get(query)
+        if cached is not None:
+            return cached
+
+        titles_folded = self._titles_folded
+        previous = self._match_cache.get(query[:-1]) if len(query) > 1 else None
+
+        # Titles starting with the input (case insensitive) form a range of
+        # the sorted case-folded titles, within the previous prefix range
+        lo_bound, hi_bound = 0, len(titles_folded)
+        if isinstance(previous, range):
+            lo_bound, hi_bound = previous.start, previous.stop
+        lo = bisect_left(titles_folded, query, lo_bound, hi_bound)
+        hi = bisect_right(titles_folded, query + "\U0010ffff", lo, hi_bound)
+
+        if lo < hi:
+            matches: Sequence[int] = range(lo, hi)
+        elif isinstance(previous, list) and len(previous) < self.SUBSTRING_MATCH_LIMIT:
+            # Titles containing the query also contain its prefix (only
+            # usable when the previous scan was not cut short)
+            matches = [i for i in previous if query in titles_folded[i]]
+        else:
+            # If no exact starts, find titles that contain the input,
+            # stopping once there are enough candidates to rank
+            matches = []
+            blob, starts = self._titles_blob, self._title_starts
+            needle = query.encode("utf-8")
+            pos = blob.find(needle)
+            while pos != -1:
+                i = bisect_right(starts, pos) - 1
+                matches.append(i)
+                if len(matches) >= self.SUBSTRING_MATCH_LIMIT:
+                    break
+                pos = blob.find(needle, starts[i + 1])  # resume at the next title
+
+        if len(self._match_cache) >= 256:
+            del self._match_cache[next(iter(self._match_cache))]  # evict the oldest entry
+        self._match_cache[query] = matches
+        return matches
+
     def _create_results_view(self) -> Panel:
         """Create search results view."""
         if not self.state.search_results:
@@ -319,68 +555,67 @@ class DashboardUI:
 
         return Panel(details, title="Details", box=box.ROUNDED)
 
-    def _get_key_non_blocking(self) -> Optional[str]:
-        """Get a key press without blocking. Returns None if no key is pressed."""
-        if msvcrt.kbhit():
+    def _key_reader(self, keys: KeyReader) -> None:
+        """Read key presses on a background thread and queue them.
+
+        The reader blocks until a key is pressed, so the main loop can sleep
+        on the queue instead of polling the keyboard.
+        """
+        while True:
             try:
-                key = msvcrt.getch()
-                # Handle special keys
-                if key == b'\xe0':  # Special key prefix
-                    key = msvcrt.getch()
-                    if key == b'H':  # Up arrow
-                        return "up"
-                    elif key == b'P':  # Down arrow
-                        return "down"
-                    elif key == b'K':  # Left arrow
-                        return "left"
-                    elif key == b'M':  # Right arrow
-                        return "right"
-                elif key == b'\r':  # Enter
-                    return "\r"
-                else:
-                    return key.decode('utf-8', errors='ignore')
-            except:
-                return None
-        return None
+                key = keys.read()
+            except EOFError:
+                return
+            except Exception:
+                continue
+            if key:
+                self._key_q.put(key)
+
+    def _get_key_non_blocking(self) -> Optional[str]:
+        """Get a queued key press without blocking. Returns None if no key is pending."""
+        try:
+            return self._key_q.get_nowait()
+        except queue.Empty:
+            return None
 
     def _create_help_view(self) -> Panel:
         """Create help view with keyboard shortcuts."""
-        # Create table content as Rich Text
-        table_text = Text()
-        table_text.append("Key    Action\n", style="bold blue")
-        table_text.append("─" * 25 + "\n")
-
-        shortcuts = [
-            ("d", "Dashboard"),
-            ("t", "Text Search"),
-            ("s", "Title Search"),
-            ("↑/↓", "Navigate Results/Matches"),
-            ("m", "Find More Similar (Results)"),
-            ("Enter", "Select Item/Details"),
-            ("h", "Help"),
-            ("q", "Quit"),
-            ("Esc", "Back/Cancel"),
-        ]
-
-        for key, action in shortcuts:
-            table_text.append(f"{key:<6} {action}\n")
-
-        content_text = Text()
-        content_text.append("Keyboard Shortcuts\n\n", style="bold")
-        content_text.append("Navigate using the keys shown. Most actions are single-keypress.\n\n")
-        content_text.append("• Text Search: Type a description of what you want to watch\n")
-        content_text.append("• Title Search: Type a title name, see matching titles, navigate with arrows, select with Enter\n")
-        content_text.append("• Results: Use ↑↓ to navigate, 'm' to find more similar titles to the selected one\n")
-        content_text.append(table_text)
-
-        return Panel(content_text, title="Help", box=box.ROUNDED)
+        return self._help_panel
+
+    def _build_help_view(self) -> Panel:
+        """Build the help panel."""
+        rows = "".join(f"{key:<6} {action}\n" for key, action in self.HELP_SHORTCUTS)
+
+        return Panel(_styled_text([
+            ("Keyboard Shortcuts\n\n", "bold"),
+            ("Navigate using the keys shown. Most actions are single-keypress.\n\n"
+             "• Text Search: Type a description of what you want to watch\n"
+             "• Title Search: Type a title name, see matching titles, navigate with arrows, select with Enter\n"
+             "• Results: Use ↑↓ to navigate, 'm' to find more similar titles to the selected one\n", None),
+            ("Key    Action\n", "bold blue"),
+            ("─" * 25 + "\n" + rows, None),
+        ]), title="Help", box=box.ROUNDED)
 
     def _create_status_bar(self) -> Panel:
         """Create status bar with current state info."""
+        sec = int(time.time())
+        if sec != self._clock[0]:
+            self._clock = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+
+        key = (self.state.current_view, sec,
+               len(self.state.search_results or ()), self.state.error_message)
+        cached_key, panel = self._status_bar_cache
+        if key != cached_key:
+            panel = self._build_status_bar()
+            self._status_bar_cache = (key, panel)
+        return panel
+
+    def _build_status_bar(self) -> Panel:
+        """Build the status bar panel."""
         view_name = self.state.current_view.value.replace("_", " ").title()
         status_parts = [
             f"View: {view_name}",
-            f"Time: {time.strftime('%H:%M:%S')}",
+            f"Time: {self._clock[1]}",
         ]
 
         if self.state.search_results:
@@ -395,64 +630,87 @@ class DashboardUI:
 
     def _create_footer(self) -> Panel:
         """Create footer with key hints."""
-        hints = {
-            ViewState.DASHBOARD: "[t] Text Search | [s] Title Search | [h] Help | [q] Quit",
-            ViewState.SEARCH_TEXT: "[Type to search] [Enter] Submit | [Esc] Cancel",
-            ViewState.SEARCH_TITLE: "[Type to search] [↑↓] Navigate matches | [Enter] Select | [Esc] Cancel",
-            ViewState.RESULTS: "[↑↓] Navigate | [m] More similar | [d] Dashboard | [q] Quit",
-            ViewState.HELP: "[d] Dashboard | [q] Quit",
-        }
-
-        hint_text = hints.get(self.state.current_view, "[q] Quit")
+        return self._footers.get(self.state.current_view, self._default_footer)
+
+    def _build_footer(self, hint_text: str) -> Panel:
+        """Build a footer panel showing the given key hints."""
         return Panel(Text(hint_text, style="dim"), box=box.SIMPLE, border_style="dim")
 
     def _render_layout(self) -> Layout:
-        """Render the current layout based on view state."""
-        layout = Layout()
+        """Update the layout's panels for the current view state."""
+        layout = self._layout
 
         # Header always visible
-        layout.split_column(
-            Layout(self._create_header(), size=5),
-            Layout(name="main", ratio=1),
-            Layout(self._create_footer(), size=3)
-        )
+        layout["header"].update(self._create_header())
+        layout["footer"].update(self._create_footer())
 
         main_layout = layout["main"]
 
-        if self.state.current_view == ViewState.DASHBOARD:
+        if self.state.is_loading:
+            main_layout.update(self._loading_panel)
+        elif self.state.current_view == ViewState.DASHBOARD:
             main_layout.update(self._create_dashboard_view())
         elif self.state.current_view in (ViewState.SEARCH_TEXT, ViewState.SEARCH_TITLE):
             main_layout.update(self._create_search_view())
         elif self.state.current_view == ViewState.RESULTS:
-            main_layout.split_row(
-                Layout(self._create_results_view(), ratio=2),
-                Layout(self._create_detail_view(), ratio=1)
-            )
+            self._results_layout["results"].update(self._create_results_view())
+            self._results_layout["detail"].update(self._create_detail_view())
+            main_layout.update(self._results_layout)
         elif self.state.current_view == ViewState.HELP:
             main_layout.update(self._create_help_view())
 
         return layout
 
-    def _handle_search(self, search_type: str) -> None:
-        """Handle search operation."""
-        self.state.is_loading = True
+    def _handle_search(self, search_type: str, embedding_idx: Optional[int] = None) -> None:
+        """Start a search on the worker thread; _poll_search installs the results.
+
+        Args:
+            search_type: "text", "title", or "similar" to search from the
+                stored vector at embedding_idx (falling back to a title search
+                when the document has no index position).
+            embedding_idx: Index position of the reference document.
+        """
         self.state.error_message = ""
 
+        if self.engine is None:
+            if self._init_future is not None:
+                self.state.error_message = "Engine still loading…"
+            else:
+                self.state.error_message = "Search engine unavailable"
+            return
+
         try:
-            if search_type == "text":
+            if search_type == "similar" and embedding_idx is not None:
+                search, query = self.engine.by_vector_id, embedding_idx
+            elif search_type == "text":
                 if not self.state.search_query.strip():
                     self.state.error_message = "Please enter a search query"
                     return
-                self.state.search_results = self.engine.by_text(
-                    self.state.search_query, config.DEFAULT_RESULTS_N
-                )
+                search, query = self.engine.by_text, self.state.search_query
             else:  # title search
                 if not self.state.search_query.strip():
                     self.state.error_message = "Please enter a title"
                     return
-                self.state.search_results = self.engine.by_title(
-                    self.state.search_query, config.DEFAULT_RESULTS_N
-                )
+                search, query = self.engine.by_title, self.state.search_query
+
+            self._search_future = self._search_executor.submit(search, query, config.DEFAULT_RESULTS_N)
+            self.state.is_loading = True
+
+        except Exception as e:
+            self.state.error_message = f"Search failed: {e}"
+
+    def _poll_search(self) -> None:
+        """Install the results of the pending search once it has finished."""
+        future = self._search_future
+        if future is None or not future.done():
+            return
+
+        self._search_future = None
+        self.state.is_loading = False
+        self._dirty = True
+
+        try:
+            self.state.search_results = future.result()
 
             if self.state.search_results:
                 self.state.current_view = ViewState.RESULTS
@@ -462,8 +720,6 @@ class DashboardUI:
 
         except Exception as e:
             self.state.error_message = f"Search failed: {e}"
-        finally:
-            self.state.is_loading = False
 
     def _get_search_input(self) -> Optional[str]:
         """Get search input from user."""
@@ -471,134 +727,169 @@ class DashboardUI:
             if self.state.current_view == ViewState.SEARCH_TEXT:
                 return Prompt.ask("Describe what you want").strip()
             else:  # SEARCH_TITLE
+                from prompt_toolkit import prompt
+
                 return prompt("Start typing title: ", completer=self.completer).strip()
         except KeyboardInterrupt:
             return None
 
+    def _handle_key(self, key: str) -> bool:
+        """Apply a key press to the application state.
+
+        Returns:
+            bool: False if the application should quit, True otherwise.
+        """
+        # Debug: show what key was pressed
+        # print(f"Key pressed: {key!r}, view: {self.state.current_view}, has_matches: {bool(self.state.title_matches)}")  # Uncomment for debugging
+
+        if self.state.is_loading:
+            if key == "q":
+                return False
+            if key == "\x1b":  # abandon the pending search; its result is discarded
+                self._search_future = None
+                self._held_keys.clear()
+                self.state.is_loading = False
+                self.state.current_view = ViewState.DASHBOARD
+                self._dirty = True
+            else:
+                self._held_keys.append(key)  # handled once the search finishes
+            return True
+
+        try:
+            if self.state.current_view in (ViewState.SEARCH_TEXT, ViewState.SEARCH_TITLE):
+                # Handle character-by-character input for search
+                if key == "\r":  # Enter key
+                    if self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
+                        # Use selected title for title search
+                        selected_title = self.state.title_matches[self.state.selected_title_index]
+                        self.state.search_query = selected_title
+                        self._handle_search("title")
+                        self.state.search_input_buffer = ""  # Clear buffer
+                        self.state.title_matches = []  # Clear matches
+                    elif self.state.search_input_buffer.strip():
+                        self.state.search_query = self.state.search_input_buffer
+                        search_type = "text" if self.state.current_view == ViewState.SEARCH_TEXT else "title"
+                        self._handle_search(search_type)
+                        self.state.search_input_buffer = ""  # Clear buffer
+                        if self.state.current_view == ViewState.SEARCH_TITLE:
+                            self.state.title_matches = []  # Clear matches
+                    else:
+                        self.state.error_message = "Please enter a search query"
+                    self._dirty = True
+                elif key == "\x1b":  # Escape key
+                    self.state.current_view = ViewState.DASHBOARD
+                    self.state.search_input_buffer = ""
+                    self.state.title_matches = []
+                    self._dirty = True
+                elif key == "\x08" or key == "\x7f":  # Backspace/Delete
+                    self.state.search_input_buffer = self.state.search_input_buffer[:-1]
+                    if self.state.current_view == ViewState.SEARCH_TITLE:
+                        self._update_title_matches()
+                    self._dirty = True
+                elif key in ("up", "k") and self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
+                    # Navigate title matches
+                    self.state.selected_title_index = max(0, self.state.selected_title_index - 1)
+                    self._dirty = True
+                elif key in ("down", "j") and self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
+                    # Navigate title matches
+                    self.state.selected_title_index = min(len(self.state.title_matches) - 1, self.state.selected_title_index + 1)
+                    self._dirty = True
+                elif len(key) == 1 and key.isprintable():  # Regular character
+                    self.state.search_input_buffer += key
+                    if self.state.current_view == ViewState.SEARCH_TITLE:
+                        self._update_title_matches()
+                    self._dirty = True
+                # Ignore other keys
+            else:
+                # Regular key input
+                if key == "q":
+                    return False
+                elif key == "d":
+                    self.state.current_view = ViewState.DASHBOARD
+                    self.state.error_message = ""
+                    self._dirty = True
+                elif key == "t":
+                    self.state.current_view = ViewState.SEARCH_TEXT
+                    self._dirty = True
+                elif key == "s":
+                    self.state.current_view = ViewState.SEARCH_TITLE
+                    self.state.search_input_buffer = ""
+                    self.state.title_matches = []
+                    self.state.selected_title_index = 0
+                    self._dirty = True
+                elif key == "h":
+                    self.state.current_view = ViewState.HELP
+                    self._dirty = True
+                elif key in ("up", "k") and self.state.current_view == ViewState.RESULTS:
+                    self.state.selected_result = max(0, self.state.selected_result - 1)
+                    self._dirty = True
+                elif key in ("down", "j") and self.state.current_view == ViewState.RESULTS:
+                    self.state.selected_result = min(
+                        len(self.state.search_results) - 1 if self.state.search_results else 0,
+                        self.state.selected_result + 1
+                    )
+                    self._dirty = True
+                elif key == "\r" and self.state.current_view == ViewState.RESULTS:
+                    # Enter key - could expand details or take action
+                    pass
+                elif key == "m" and self.state.current_view == ViewState.RESULTS and self.state.search_results:
+                    # Find more similar titles based on selected result
+                    if self.state.selected_result < len(self.state.search_results):
+                        _, selected_item = self.state.search_results[self.state.selected_result]
+                        if selected_item:
+                            selected_title = selected_item.get("title_romaji") or selected_item.get("title_english")
+                            if selected_title:
+                                self.state.search_query = selected_title
+                                self._handle_search("similar", selected_item.get("embedding_idx"))
+                                self._dirty = True
+                # else:
+                #     self.state.error_message = f"Unknown key: {key!r}"  # Uncomment for debugging
+
+        except Exception as e:
+            self.state.error_message = f"Input error: {e}"
+            self._dirty = True
+
+        return True
+
     def run(self) -> None:
         """Main application loop."""
         try:
-            with Live(self._render_layout(), console=self.console, refresh_per_second=20) as live:
+            with KeyReader() as keys, \
+                    Live(self._render_layout(), console=self.console, refresh_per_second=20) as live:
                 last_refresh = time.time()
-
-                while True:
+                running = True
+                threading.Thread(target=self._key_reader, args=(keys,), daemon=True).start()
+
+                while running:
+                    # Sleep until a key arrives, waking in time for a pending
+                    # redraw or the next refresh
+                    try:
+                        key = self._key_q.get(timeout=0.016 if self._dirty else 0.05)
+                    except queue.Empty:
+                        key = None
+
+                    # Drain every pending key before rendering, so a burst of
+                    # typing produces one redraw rather than one per key
+                    while key:
+                        if not self._handle_key(key):
+                            running = False
+                            break
+                        key = self._get_key_non_blocking()
+
+                    self._poll_init()
+                    self._poll_search()
+
+                    # Replay keys typed during a search that has now finished
+                    while running and self._held_keys and not self.state.is_loading:
+                        running = self._handle_key(self._held_keys.popleft())
+
+                    # Rebuild the layout at most once per frame window; Live's
+                    # refresh thread paints it
                     current_time = time.time()
-
-                    # Handle input (non-blocking)
-                    key = self._get_key_non_blocking()
-
-                    if key:
-                        # Debug: show what key was pressed
-                        # print(f"Key pressed: {key!r}, view: {self.state.current_view}, has_matches: {bool(self.state.title_matches)}")  # Uncomment for debugging
-
-                        state_changed = False
-
-                        try:
-                            if self.state.current_view in (ViewState.SEARCH_TEXT, ViewState.SEARCH_TITLE):
-                                # Handle character-by-character input for search
-                                if key == "\r":  # Enter key
-                                    if self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
-                                        # Use selected title for title search
-                                        selected_title = self.state.title_matches[self.state.selected_title_index]
-                                        self.state.search_query = selected_title
-                                        self._handle_search("title")
-                                        self.state.search_input_buffer = ""  # Clear buffer
-                                        self.state.title_matches = []  # Clear matches
-                                        # Force immediate display update
-                                        live.update(self._render_layout())
-                                    elif self.state.search_input_buffer.strip():
-                                        self.state.search_query = self.state.search_input_buffer
-                                        search_type = "text" if self.state.current_view == ViewState.SEARCH_TEXT else "title"
-                                        self._handle_search(search_type)
-                                        self.state.search_input_buffer = ""  # Clear buffer
-                                        if self.state.current_view == ViewState.SEARCH_TITLE:
-                                            self.state.title_matches = []  # Clear matches
-                                        # Force immediate display update
-                                        live.update(self._render_layout())
-                                    else:
-                                        self.state.error_message = "Please enter a search query"
-                                        state_changed = True
-                                elif key == "\x1b":  # Escape key
-                                    self.state.current_view = ViewState.DASHBOARD
-                                    self.state.search_input_buffer = ""
-                                    self.state.title_matches = []
-                                    state_changed = True
-                                elif key == "\x08" or key == "\x7f":  # Backspace/Delete
-                                    self.state.search_input_buffer = self.state.search_input_buffer[:-1]
-                                    if self.state.current_view == ViewState.SEARCH_TITLE:
-                                        self._update_title_matches()
-                                    state_changed = True
-                                elif key in ("up", "k") and self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
-                                    # Navigate title matches
-                                    self.state.selected_title_index = max(0, self.state.selected_title_index - 1)
-                                    state_changed = True
-                                elif key in ("down", "j") and self.state.current_view == ViewState.SEARCH_TITLE and self.state.title_matches:
-                                    # Navigate title matches
-                                    self.state.selected_title_index = min(len(self.state.title_matches) - 1, self.state.selected_title_index + 1)
-                                    state_changed = True
-                                elif len(key) == 1 and key.isprintable():  # Regular character
-                                    self.state.search_input_buffer += key
-                                    if self.state.current_view == ViewState.SEARCH_TITLE:
-                                        self._update_title_matches()
-                                    state_changed = True
-                                # Ignore other keys
-                            else:
-                                # Regular key input
-                                if key == "q":
-                                    break
-                                elif key == "d":
-                                    self.state.current_view = ViewState.DASHBOARD
-                                    self.state.error_message = ""
-                                    state_changed = True
-                                elif key == "t":
-                                    self.state.current_view = ViewState.SEARCH_TEXT
-                                    state_changed = True
-                                elif key == "s":
-                                    self.state.current_view = ViewState.SEARCH_TITLE
-                                    self.state.search_input_buffer = ""
-                                    self.state.title_matches = []
-                                    self.state.selected_title_index = 0
-                                    state_changed = True
-                                elif key == "h":
-                                    self.state.current_view = ViewState.HELP
-                                    state_changed = True
-                                elif key in ("up", "k") and self.state.current_view == ViewState.RESULTS:
-                                    self.state.selected_result = max(0, self.state.selected_result - 1)
-                                    state_changed = True
-                                elif key in ("down", "j") and self.state.current_view == ViewState.RESULTS:
-                                    self.state.selected_result = min(
-                                        len(self.state.search_results) - 1 if self.state.search_results else 0,
-                                        self.state.selected_result + 1
-                                    )
-                                    state_changed = True
-                                elif key == "\r" and self.state.current_view == ViewState.RESULTS:
-                                    # Enter key - could expand details or take action
-                                    pass
-                                elif key == "m" and self.state.current_view == ViewState.RESULTS and self.state.search_results:
-                                    # Find more similar titles based on selected result
-                                    if self.state.selected_result < len(self.state.search_results):
-                                        _, selected_item = self.state.search_results[self.state.selected_result]
-                                        if selected_item:
-                                            selected_title = selected_item.get("title_romaji") or selected_item.get("title_english")
-                                            if selected_title:
-                                                self.state.search_query = selected_title
-                                                self._handle_search("title")
-                                                # Force immediate display update
-                                                live.update(self._render_layout())
-                                # else:
-                                #     self.state.error_message = f"Unknown key: {key!r}"  # Uncomment for debugging
-
-                        except Exception as e:
-                            self.state.error_message = f"Input error: {e}"
-                            state_changed = True
-
-                        # Update display immediately if state changed
-                        if state_changed:
-                            live.update(self._render_layout())
-                            continue
-
-                    # Small sleep to prevent CPU hogging
-                    time.sleep(0.01)
+                    if running and self._dirty and current_time - last_refresh > 0.016:
+                        live.update(self._render_layout())
+                        last_refresh = current_time
+                        self._dirty = False
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Application interrupted by user.[/yellow]")
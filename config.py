@@ -10,16 +10,50 @@ ENGINE_DIR = PROJECT_ROOT / "engine"
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 
 # Data files
-EMBEDDINGS_FILE = DATA_DIR / "embeddings.pkl"
+EMBEDDINGS_FILE = DATA_DIR / "embeddings.npy"
+LEGACY_EMBEDDINGS_FILE = DATA_DIR / "embeddings.pkl"  # pickled {"embeddings": array}, converted on first index build
 FAISS_INDEX_FILE = DATA_DIR / "faiss.index"
 
+# FAISS HNSW graph parameters: links per node, build-time and query-time
+# candidate list sizes (efSearch should stay above DEFAULT_SEARCH_K)
+FAISS_HNSW_M = 32
+FAISS_HNSW_EF_CONSTRUCTION = 200
+FAISS_HNSW_EF_SEARCH = 64
+
+# Local cache of autocomplete titles
+TITLES_CACHE_FILE = Path.home() / ".cache" / "anime-tui" / "titles.json"
+TITLES_CACHE_TTL = 24 * 60 * 60  # seconds
+TITLES_BATCH_SIZE = 5000  # documents per cursor round-trip
+
 # Database configuration
 MONGO_URI = "mongodb://localhost:27017/"
 DB_NAME = "anime_manga_db"
 COLLECTION_NAME = "titles"
+INSERT_BATCH_SIZE = 1000  # documents per unordered insert_many call
+DOCUMENTS_BATCH_SIZE = 5000  # documents per cursor round-trip when loading
+
+# Longest description preview shown by the UIs
+DESCRIPTION_PREVIEW_CHARS = 300
+
+# Fields the recommender loads: ranking metadata and display fields.
+# Descriptions are cut server-side, keeping one extra character so the UIs
+# can still tell that a description was truncated.
+RECOMMENDER_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "type": 1,
+    "title_romaji": 1,
+    "title_english": 1,
+    "description": {"$substrCP": ["$description", 0, DESCRIPTION_PREVIEW_CHARS + 1]},
+    "genres": 1,
+    "popularity": 1,
+    "average_score": 1,
+}
 
 # Model configuration
 SENTENCE_TRANSFORMER_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 128  # texts per forward pass when building embeddings
+QUERY_EMBEDDING_CACHE_SIZE = 1024  # recent query embeddings kept by the recommender
 
 # Ranking weights
 SEMANTIC_WEIGHT = 0.65
@@ -6,6 +6,27 @@ import re
 from typing import List, Dict, Optional
 from tqdm import tqdm
 import fetch_data as fetch
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def save_json(items: List[Dict], filepath: str) -> None:
+    """Write items to a UTF-8 JSON file indented by two spaces.
+
+    Args:
+        items: Documents to save.
+        filepath: Destination file path.
+    """
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(items, f, ensure_ascii=False, indent=2)
+
 # -----------------------------
 # Main
 # -----------------------------
@@ -37,26 +58,29 @@ def main() -> None:
     all_items: List[Dict] = []
     # 2Kitsu Anime
     print("KITSU")
-    for media in tqdm(fetch.fetch_kitsu("anime")):
-        all_items.append(fetch.normalize_kitsu(media, "ANIME"))
+    all_items.extend(
+        fetch.normalize_kitsu(media, "ANIME")
+        for media in tqdm(fetch.fetch_kitsu("anime"), mininterval=0.5, miniters=100)
+    )
 
     # 3️Kitsu Manga
-    for media in tqdm(fetch.fetch_kitsu("manga")):
-        all_items.append(fetch.normalize_kitsu(media, "MANGA"))
+    all_items.extend(
+        fetch.normalize_kitsu(media, "MANGA")
+        for media in tqdm(fetch.fetch_kitsu("manga"), mininterval=0.5, miniters=100)
+    )
 
-    with open(fetch.OUTPUT_JSON_KITSU, "w", encoding="utf-8") as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
+    save_json(all_items, fetch.OUTPUT_JSON_KITSU)
     print("DONE")
     
-    all_items: List[Dict] = []
     # 4️MangaDex Manga
     print("MANGADEX")
-    for media in tqdm(fetch.fetch_mangadex()):
-        all_items.append(fetch.normalize_mangadex(media))
+    all_items = [
+        fetch.normalize_mangadex(media)
+        for media in tqdm(fetch.fetch_mangadex(), mininterval=0.5, miniters=100)
+    ]
 
     # Save JSON
-    with open(fetch.OUTPUT_JSON_MANGADEX, "w", encoding="utf-8") as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
+    save_json(all_items, fetch.OUTPUT_JSON_MANGADEX)
     print("DONE")
     
     print(f"Saved All Items")
@@ -1,33 +1,60 @@
 """MongoDB database operations for the recommendation system."""
 
-from typing import List, Dict, Optional
+import atexit
+import threading
+from typing import List, Dict, Optional, Tuple
 from pymongo import MongoClient
 from pymongo.collection import Collection
-from pymongo.errors import ConnectionFailure, OperationFailure
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
 import config
 
+# One client (and its connection pool) shared by every caller in the process
+_client: Optional[MongoClient] = None
+_collection: Optional[Collection] = None
+_lock = threading.Lock()
+
 
 def get_collection() -> Collection:
     """Connect to MongoDB and return the titles collection.
 
+    The client is created and pinged on first use, then reused.
+
     Returns:
         Collection: MongoDB collection for titles.
 
     Raises:
         ConnectionFailure: If unable to connect to MongoDB.
     """
-    try:
-        client = MongoClient(config.MONGO_URI, serverSelectionTimeoutMS=5000)
-        # Test the connection
-        client.admin.command('ping')
-        return client[config.DB_NAME][config.COLLECTION_NAME]
-    except ConnectionFailure as e:
-        raise ConnectionFailure(f"Failed to connect to MongoDB at {config.MONGO_URI}: {e}")
+    global _client, _collection
+
+    with _lock:
+        if _collection is not None:
+            return _collection
+
+        client = MongoClient(config.MONGO_URI, serverSelectionTimeoutMS=5000, maxPoolSize=50)
+        try:
+            # Test the connection
+            client.admin.command('ping')
+        except ConnectionFailure as e:
+            client.close()
+            raise ConnectionFailure(f"Failed to connect to MongoDB at {config.MONGO_URI}: {e}")
 
+        _client = client
+        _collection = client[config.DB_NAME][config.COLLECTION_NAME]
+        atexit.register(client.close)
+        return _collection
 
-def get_documents() -> List[Dict]:
+
+def get_documents(
+    projection: Optional[Dict] = None, batch_size: int = config.DOCUMENTS_BATCH_SIZE
+) -> List[Dict]:
     """Retrieve all documents from the titles collection.
 
+    Args:
+        projection: Optional MongoDB projection limiting the returned fields.
+            Defaults to returning whole documents.
+        batch_size: Number of documents fetched per cursor round-trip.
+
     Returns:
         List[Dict]: List of all title documents.
 
@@ -36,37 +63,43 @@ def get_documents() -> List[Dict]:
     """
     try:
         collection = get_collection()
-        return list(collection.find())
+        return list(collection.find({}, projection).batch_size(batch_size))
     except OperationFailure as e:
         raise OperationFailure(f"Failed to retrieve documents: {e}")
 
 
-def get_all_titles() -> List[str]:
+def get_all_titles() -> Tuple[str, ...]:
     """Retrieve all title names for autocomplete.
 
+    Only the two title fields are fetched, streamed in large cursor batches.
+
     Returns:
-        List[str]: List of title strings (romaji or english).
+        Tuple[str, ...]: Title strings (romaji or english).
 
     Raises:
         OperationFailure: If database operation fails.
     """
     try:
         collection = get_collection()
-        titles = []
-        for doc in collection.find({}, {"title_romaji": 1, "title_english": 1}):
-            title = doc.get("title_romaji") or doc.get("title_english")
-            if title:
-                titles.append(title)
-        return titles
+        cursor = collection.find(
+            {}, {"title_romaji": 1, "title_english": 1, "_id": 0}
+        ).batch_size(config.TITLES_BATCH_SIZE)
+        titles = (doc.get("title_romaji") or doc.get("title_english") for doc in cursor)
+        return tuple(title for title in titles if title)
     except OperationFailure as e:
         raise OperationFailure(f"Failed to retrieve titles: {e}")
 
 
-def insert_documents(documents: List[Dict]) -> None:
+def insert_documents(documents: List[Dict], batch_size: int = config.INSERT_BATCH_SIZE) -> None:
     """Insert multiple documents into the collection.
 
+    Documents are sent in unordered batches, so the server can apply each
+    batch without stopping at the first error. Documents whose ``id``
+    already exists are skipped.
+
     Args:
         documents: List of documents to insert.
+        batch_size: Number of documents per insert request.
 
     Raises:
         OperationFailure: If insertion fails.
@@ -76,11 +109,35 @@ def insert_documents(documents: List[Dict]) -> None:
 
     try:
         collection = get_collection()
-        collection.insert_many(documents)
+        for start in range(0, len(documents), batch_size):
+            try:
+                collection.insert_many(documents[start:start + batch_size], ordered=False)
+            except BulkWriteError as e:
+                # Duplicate keys (code 11000) are expected when re-importing
+                if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                    raise
     except OperationFailure as e:
         raise OperationFailure(f"Failed to insert documents: {e}")
 
 
+def drop_indexes() -> None:
+    """Drop all secondary indexes from the collection.
+
+    Bulk loads into an empty collection are faster without indexes to
+    maintain; call :func:`create_indexes` afterwards.
+
+    Raises:
+        OperationFailure: If dropping the indexes fails.
+    """
+    try:
+        collection = get_collection()
+        collection.drop_indexes()
+    except OperationFailure as e:
+        if e.code == 26:  # NamespaceNotFound: the collection does not exist yet
+            return
+        raise OperationFailure(f"Failed to drop indexes: {e}")
+
+
 def create_indexes() -> None:
     """Create database indexes for efficient queries.
 
@@ -0,0 +1,46 @@
+"""Local disk cache of title names for autocomplete."""
+
+import json
+import time
+from typing import List, Optional, Sequence
+import config
+
+
+def load_cached_titles() -> Optional[List[str]]:
+    """Load title names from the local cache if it is still fresh.
+
+    Returns:
+        Optional[List[str]]: Cached titles, or None if the cache is missing,
+        older than ``config.TITLES_CACHE_TTL`` or unreadable.
+    """
+    try:
+        age = time.time() - config.TITLES_CACHE_FILE.stat().st_mtime
+        if age > config.TITLES_CACHE_TTL:
+            return None
+        with open(config.TITLES_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_titles(titles: Sequence[str]) -> Sequence[str]:
+    """Write title names to the local cache.
+
+    Failing to write the cache is not an error; the titles are simply
+    fetched from MongoDB again on the next start.
+
+    Args:
+        titles: Title strings to cache.
+
+    Returns:
+        Sequence[str]: The titles that were passed in.
+    """
+    try:
+        config.TITLES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = config.TITLES_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(titles, f, ensure_ascii=False)
+        tmp_file.replace(config.TITLES_CACHE_FILE)
+    except OSError:
+        pass
+    return titles
@@ -1,8 +1,7 @@
 """Hybrid ranking algorithm combining semantic similarity with metadata."""
 
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Iterable, Optional
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 import config
 
 
@@ -15,12 +14,21 @@ def normalize_values(values: List[float]) -> np.ndarray:
     Returns:
         np.ndarray: Normalized values.
     """
-    if not values:
-        return np.array([])
-    return MinMaxScaler().fit_transform(np.array(values).reshape(-1, 1)).flatten()
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
 
+    low = values.min()
+    value_range = values.max() - low
+    if value_range == 0:
+        return np.zeros_like(values)
 
-def calculate_genre_overlap(genres_a: List[str], genres_b: List[str]) -> float:
+    normalized = np.subtract(values, low)
+    normalized /= value_range
+    return normalized
+
+
+def calculate_genre_overlap(genres_a: Iterable[str], genres_b: Iterable[str]) -> float:
     """Calculate Jaccard similarity between two genre lists.
 
     Args:
@@ -42,7 +50,26 @@ def calculate_genre_overlap(genres_a: List[str], genres_b: List[str]) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def rank_candidates(candidates: List[Dict], reference_genres: List[str]) -> List[Tuple[float, Dict]]:
+def calculate_genre_overlap_mask(mask_a: int, mask_b: int) -> float:
+    """Calculate Jaccard similarity between two genre bitmasks.
+
+    Each bit stands for one genre of a shared vocabulary, so the overlap is
+    a ratio of popcounts instead of set operations.
+
+    Args:
+        mask_a: First genre bitmask.
+        mask_b: Second genre bitmask.
+
+    Returns:
+        float: Similarity score between 0 and 1.
+    """
+    union = (mask_a | mask_b).bit_count()
+    return (mask_a & mask_b).bit_count() / union if union else 0.0
+
+
+def rank_candidates(
+    candidates: List[Dict], reference_genres: Iterable[str], n: Optional[int] = None
+) -> List[Tuple[float, Dict]]:
     """Rank candidates using hybrid scoring algorithm.
 
     Combines semantic similarity, genre overlap, popularity, and rating scores.
@@ -50,6 +77,8 @@ def rank_candidates(candidates: List[Dict], reference_genres: List[str]) -> List
     Args:
         candidates: List of candidate documents with scores.
         reference_genres: Genres from reference document for similarity.
+        n: Optional number of top results to return. Defaults to ranking
+            every candidate.
 
     Returns:
         List[Tuple[float, Dict]]: Ranked list of (score, document) tuples.
@@ -57,29 +86,63 @@ def rank_candidates(candidates: List[Dict], reference_genres: List[str]) -> List
     if not candidates:
         return []
 
-    # Extract scores
-    semantic_scores = [c.get("semantic", 0.0) for c in candidates]
-    popularity_scores = [c.get("popularity", 0) for c in candidates]
-    rating_scores = [c.get("rating", 0) for c in candidates]
-
-    # Normalize metadata scores
-    normalized_popularity = normalize_values(popularity_scores)
-    normalized_rating = normalize_values(rating_scores)
-
-    # Calculate hybrid scores
-    ranked = []
-    for candidate, pop_norm, rating_norm in zip(candidates, normalized_popularity, normalized_rating):
-        genre_overlap = calculate_genre_overlap(reference_genres, candidate.get("genres", []))
-
-        # Weighted combination
-        total_score = (
-            config.SEMANTIC_WEIGHT * candidate["semantic"] +
-            config.GENRE_OVERLAP_WEIGHT * genre_overlap +
-            config.POPULARITY_WEIGHT * pop_norm +
-            config.RATING_WEIGHT * rating_norm
+    count = len(candidates)
+
+    if reference_genres:
+        genre_overlap = np.fromiter(
+            (calculate_genre_overlap(reference_genres, c.get("genres"))
+             for c in candidates),
+            dtype=np.float64, count=count
         )
+    else:
+        genre_overlap = np.zeros(count)
+
+    ranked = rank_arrays(
+        np.fromiter((c["semantic"] for c in candidates), dtype=np.float64, count=count),
+        genre_overlap,
+        np.fromiter((c.get("popularity") or 0 for c in candidates), dtype=np.float64, count=count),
+        np.fromiter((c.get("rating") or 0 for c in candidates), dtype=np.float64, count=count),
+        n,
+    )
+    return [(score, candidates[i]["doc"]) for score, i in ranked]
+
+
+def rank_arrays(
+    semantic_scores: np.ndarray,
+    genre_overlap: np.ndarray,
+    popularity: np.ndarray,
+    rating: np.ndarray,
+    n: Optional[int] = None,
+) -> List[Tuple[float, int]]:
+    """Rank candidates given as parallel arrays using the hybrid score.
+
+    Args:
+        semantic_scores: Semantic similarity of each candidate.
+        genre_overlap: Genre similarity of each candidate to the reference.
+        popularity: Raw popularity of each candidate.
+        rating: Raw rating of each candidate.
+        n: Optional number of top results to return. Defaults to ranking
+            every candidate.
 
-        ranked.append((total_score, candidate["doc"]))
+    Returns:
+        List[Tuple[float, int]]: Ranked (score, candidate position) tuples.
+    """
+    count = len(semantic_scores)
+    if count == 0:
+        return []
 
-    # Sort by score descending
-    return sorted(ranked, key=lambda x: x[0], reverse=True)
+    # Weighted combination
+    scores = (
+        config.SEMANTIC_WEIGHT * np.asarray(semantic_scores, dtype=np.float64) +
+        config.GENRE_OVERLAP_WEIGHT * np.asarray(genre_overlap, dtype=np.float64) +
+        config.POPULARITY_WEIGHT * normalize_values(popularity) +
+        config.RATING_WEIGHT * normalize_values(rating)
+    )
+
+    # Sort by score descending; the stable sort keeps tied candidates in
+    # input order, so the top n are always a prefix of the full ranking
+    order = np.argsort(-scores, kind="stable")
+    if n is not None:
+        order = order[:n]
+
+    return [(float(scores[i]), int(i)) for i in order]
@@ -1,70 +1,174 @@
 """Core recommendation engine using semantic search and hybrid ranking."""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
-import pickle
+import threading
 import faiss
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from db.mongo import get_documents
-from engine.text_builder import build_text
-from engine.hybrid_ranker import rank_candidates
+from engine.hybrid_ranker import calculate_genre_overlap_mask, rank_arrays
 import config
 
 
 class Recommender:
     """AI-powered recommendation engine for anime and manga."""
 
-    def __init__(self):
-        """Initialize the recommender with pre-built embeddings and index."""
+    def __init__(self, documents: Optional[List[Dict]] = None):
+        """Initialize the recommender with the pre-built index.
+
+        Reference vectors for title searches are read back from the index,
+        so the embeddings file is only needed to build it.
+
+        The index, the model and the documents are independent, so they are
+        loaded concurrently; the index read and the database fetch mostly
+        wait on I/O outside the GIL.
+
+        Args:
+            documents: Optional pre-loaded documents, in index order, with
+                the fields of ``config.RECOMMENDER_PROJECTION``. Fetched from
+                MongoDB when omitted.
+        """
         try:
-            # Load embeddings
-            with open(config.EMBEDDINGS_FILE, "rb") as f:
-                self.embeddings_data = pickle.load(f)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                index_future = executor.submit(faiss.read_index, str(config.FAISS_INDEX_FILE))
+                model_future = executor.submit(SentenceTransformer, config.SENTENCE_TRANSFORMER_MODEL)
+                if documents is None:
+                    documents_future = executor.submit(get_documents, config.RECOMMENDER_PROJECTION)
+
+                # Load FAISS index
+                self.index = index_future.result()
+                if hasattr(self.index, "hnsw"):
+                    self.index.hnsw.efSearch = config.FAISS_HNSW_EF_SEARCH
+
+                # Load sentence transformer model
+                self.model = model_future.result()
+
+                # Load documents
+                if documents is None:
+                    documents = documents_future.result()
+
+            # Recently encoded queries, least recently used first
+            self._encode_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+            self._encode_lock = threading.Lock()
 
-            # Load FAISS index
-            self.index = faiss.read_index(str(config.FAISS_INDEX_FILE))
+            # Record each document's position in the index
+            self.documents = documents
+            for idx, doc in enumerate(self.documents):
+                doc["embedding_idx"] = idx
 
-            # Load sentence transformer model
-            self.model = SentenceTransformer(config.SENTENCE_TRANSFORMER_MODEL)
+            # Per-document genre bitmasks and lower-cased titles, built once
+            # rather than on every query. Each genre gets one bit.
+            self._genre_vocab: Dict[str, int] = {}
+            self._genre_masks: List[int] = []
+            for doc in self.documents:
+                mask = 0
+                for genre in doc.get("genres") or ():
+                    mask |= 1 << self._genre_vocab.setdefault(genre, len(self._genre_vocab))
+                self._genre_masks.append(mask)
+            self._popularity = np.array([doc.get("popularity") or 0 for doc in self.documents], dtype=np.float64)
+            self._rating = np.array([doc.get("average_score") or 0 for doc in self.documents], dtype=np.float64)
+            self._doc_titles_lower = [
+                ((doc.get("title_romaji") or "").lower(), (doc.get("title_english") or "").lower())
+                for doc in self.documents
+            ]
 
-            # Load documents
-            self.documents = get_documents()
+            # Exact lower-cased title -> document position; the first
+            # document wins when titles repeat
+            self._title_index: Dict[str, int] = {}
+            for idx, titles in enumerate(self._doc_titles_lower):
+                for doc_title in titles:
+                    if doc_title:
+                        self._title_index.setdefault(doc_title, idx)
 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Required data file not found: {e}. Run build scripts first.")
         except Exception as e:
             raise RuntimeError(f"Failed to initialize recommender: {e}")
 
-    def _search_similar(self, query_vector: np.ndarray, k: int = config.DEFAULT_SEARCH_K) -> List[Dict]:
+    def _search_similar(
+        self, query_vectors: np.ndarray, k: int = config.DEFAULT_SEARCH_K
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
         """Search for semantically similar documents using FAISS.
 
+        All queries go to the index in one call.
+
         Args:
-            query_vector: Normalized query embedding vector.
-            k: Number of candidates to retrieve.
+            query_vectors: Normalized query embedding vectors, one per row.
+            k: Number of candidates to retrieve per query.
 
         Returns:
-            List[Dict]: Candidate documents with similarity scores.
+            List[Tuple[np.ndarray, np.ndarray]]: For each query, the document
+            positions of the candidates and their similarity scores.
         """
-        # Ensure vector is normalized
-        faiss.normalize_L2(query_vector)
-
         # Search index
-        scores, indices = self.index.search(query_vector, min(k, len(self.documents)))
+        scores, indices = self.index.search(query_vectors, min(k, len(self.documents)))
 
+        # FAISS pads missing results with -1; an index built for more documents
+        # than are loaded (re-import without a rebuild) can return positions
+        # past the end
         results = []
-        for idx, score in zip(indices[0], scores[0]):
-            if idx < len(self.documents):
-                doc = self.documents[idx]
-                results.append({
-                    "doc": doc,
-                    "semantic": float(score),
-                    "genres": doc.get("genres", []),
-                    "popularity": doc.get("popularity", 0),
-                    "rating": doc.get("average_score", 0),
-                })
-
+        for row_indices, row_scores in zip(indices, scores):
+            found = (row_indices >= 0) & (row_indices < len(self.documents))
+            results.append((row_indices[found], row_scores[found]))
         return results
 
+    def _rank(
+        self, indices: np.ndarray, scores: np.ndarray, ref_mask: int, n: int
+    ) -> List[Tuple[float, Dict]]:
+        """Rank search candidates with the hybrid algorithm.
+
+        Args:
+            indices: Document positions of the candidates.
+            scores: Semantic similarity of each candidate.
+            ref_mask: Genre bitmask of the reference document, 0 for none.
+            n: Number of recommendations to return.
+
+        Returns:
+            List[Tuple[float, Dict]]: Ranked list of (score, document) tuples.
+        """
+        if ref_mask:
+            masks = self._genre_masks
+            genre_overlap = np.fromiter(
+                (calculate_genre_overlap_mask(ref_mask, masks[i]) for i in indices),
+                dtype=np.float64, count=len(indices)
+            )
+        else:
+            genre_overlap = np.zeros(len(indices))
+
+        ranked = rank_arrays(
+            scores,
+            genre_overlap,
+            self._popularity[indices],
+            self._rating[indices],
+            n,
+        )
+        return [(score, self.documents[indices[i]]) for score, i in ranked]
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Encode text as a normalized query vector, reusing recent results.
+
+        Args:
+            text: Text to encode.
+
+        Returns:
+            np.ndarray: A (1, dim) float32 vector. Callers must not modify it.
+        """
+        with self._encode_lock:
+            vector = self._encode_cache.get(text)
+            if vector is not None:
+                self._encode_cache.move_to_end(text)
+                return vector
+
+        vector = self.model.encode([text], convert_to_numpy=True, normalize_embeddings=True).astype("float32")
+
+        with self._encode_lock:
+            self._encode_cache[text] = vector
+            if len(self._encode_cache) > config.QUERY_EMBEDDING_CACHE_SIZE:
+                self._encode_cache.popitem(last=False)
+        return vector
+
     def by_text(self, query: str, n: int = config.DEFAULT_RESULTS_N) -> List[Tuple[float, Dict]]:
         """Recommend items based on text description.
 
@@ -79,13 +183,13 @@ class Recommender:
             return []
 
         # Generate query embedding
-        query_vector = self.model.encode([query], convert_to_numpy=True).astype("float32")
+        query_vector = self._embed(query)
 
         # Find candidates
-        candidates = self._search_similar(query_vector)
+        indices, scores = self._search_similar(query_vector)[0]
 
         # Rank with hybrid algorithm (no reference genres for text search)
-        return rank_candidates(candidates, [])[:n]
+        return self._rank(indices, scores, 0, n)
 
     def by_title(self, title: str, n: int = config.DEFAULT_RESULTS_N) -> List[Tuple[float, Dict]]:
         """Recommend items similar to a given title.
@@ -103,24 +207,96 @@ class Recommender:
         if not title.strip():
             return []
 
-        # Find reference document
-        reference_doc = None
-        for doc in self.documents:
-            if title.lower() in (doc.get("title_romaji") or "").lower() or \
-               title.lower() in (doc.get("title_english") or "").lower():
-                reference_doc = doc
-                break
+        return self.by_vector_id(self._find_title(title), n)
 
-        if not reference_doc:
-            raise ValueError(f"Title '{title}' not found in database")
+    def by_titles(self, titles: List[str], n: int = config.DEFAULT_RESULTS_N) -> List[List[Tuple[float, Dict]]]:
+        """Recommend items similar to each of several titles.
 
-        # Generate embedding for reference document
-        ref_text = build_text(reference_doc)
-        ref_vector = self.model.encode([ref_text], convert_to_numpy=True).astype("float32")
+        The reference vectors are searched together in one FAISS call.
 
-        # Find candidates
-        candidates = self._search_similar(ref_vector)
+        Args:
+            titles: Titles to find similar content for.
+            n: Number of recommendations to return per title.
+
+        Returns:
+            List[List[Tuple[float, Dict]]]: Ranked (score, document) tuples
+            for each title, in order.
+
+        Raises:
+            ValueError: If a title is not found in database.
+        """
+        return self.by_vector_ids([self._find_title(title) for title in titles], n)
+
+    def _find_title(self, title: str) -> int:
+        """Return the index position of the document matching a title.
+
+        Args:
+            title: Title to look up.
+
+        Returns:
+            int: Position of an exact (case insensitive) title match, else of
+            the first title containing the query.
+
+        Raises:
+            ValueError: If title is not found in database.
+        """
+        query = title.lower()
+        idx = self._title_index.get(query.strip())
+        if idx is not None:
+            return idx
+
+        for idx, (romaji, english) in enumerate(self._doc_titles_lower):
+            if query in romaji or query in english:
+                return idx
+        raise ValueError(f"Title '{title}' not found in database")
+
+    def by_vector_id(self, idx: int, n: int = config.DEFAULT_RESULTS_N) -> List[Tuple[float, Dict]]:
+        """Recommend items similar to the document at a given index position.
+
+        The reference vector is read back from the FAISS index, so no text
+        has to be encoded.
+
+        Args:
+            idx: Position of the reference document in the index, as stored
+                in its ``embedding_idx`` field.
+            n: Number of recommendations to return.
+
+        Returns:
+            List[Tuple[float, Dict]]: Ranked list of (score, document) tuples.
+
+        Raises:
+            IndexError: If idx is outside the index.
+        """
+        return self.by_vector_ids([idx], n)[0]
+
+    def by_vector_ids(self, ids: List[int], n: int = config.DEFAULT_RESULTS_N) -> List[List[Tuple[float, Dict]]]:
+        """Recommend items similar to each of several documents by index position.
+
+        Args:
+            ids: Positions of the reference documents in the index.
+            n: Number of recommendations to return per document.
+
+        Returns:
+            List[List[Tuple[float, Dict]]]: Ranked (score, document) tuples
+            for each position, in order.
+
+        Raises:
+            IndexError: If a position is outside the index.
+        """
+        if not ids:
+            return []
+        for idx in ids:
+            if not 0 <= idx < len(self.documents):
+                raise IndexError(f"Vector id {idx} is out of range")
+
+        ref_vectors = self.index.reconstruct_batch(np.asarray(ids, dtype=np.int64))
+        faiss.normalize_L2(ref_vectors)  # quantized vectors come back slightly off unit length
+
+        # Find candidates for every reference at once
+        candidates = self._search_similar(ref_vectors)
 
         # Rank with hybrid algorithm using reference genres
-        ref_genres = reference_doc.get("genres", [])
-        return rank_candidates(candidates, ref_genres)[:n]
+        return [
+            self._rank(indices, scores, self._genre_masks[idx], n)
+            for idx, (indices, scores) in zip(ids, candidates)
+        ]
@@ -1,6 +1,6 @@
 """Text building utilities for creating searchable text from documents."""
 
-from typing import Dict
+from typing import Dict, Iterable, List
 
 
 def build_text(doc: Dict) -> str:
@@ -15,12 +15,24 @@ def build_text(doc: Dict) -> str:
     Returns:
         str: Combined text string for search indexing.
     """
-    parts = [
-        doc.get("title_romaji", ""),
-        doc.get("title_english", ""),
-        " ".join(doc.get("genres", [])),
-        " ".join(doc.get("tags", [])),
-        doc.get("description", ""),
-    ]
-    return " ".join(filter(None, parts))  # Filter out empty strings
+    get = doc.get
+    parts = (
+        get("title_romaji"),
+        get("title_english"),
+        " ".join(get("genres") or ()),
+        " ".join(get("tags") or ()),
+        get("description"),
+    )
+    return " ".join([part for part in parts if part])  # Filter out empty strings
 
+
+def build_texts(docs: Iterable[Dict]) -> List[str]:
+    """Build searchable text strings for many documents.
+
+    Args:
+        docs: Document dictionaries.
+
+    Returns:
+        List[str]: Combined text string for each document, in order.
+    """
+    return [build_text(doc) for doc in docs]
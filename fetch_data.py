@@ -2,15 +2,95 @@
 
 import json
 import requests
+import threading
 import time
 import re
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Dict, Optional
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 OUTPUT_JSON = "anime_manga_all_sources.json"
+OUTPUT_JSON_ANILIST = "anime_manga_all_anilist.json"
+OUTPUT_JSON_KITSU = "anime_manga_all_kitsu.json"
+OUTPUT_JSON_MANGADEX = "anime_manga_all_mangadex.json"
 ANILIST_URL = "https://graphql.anilist.co"
 KITSU_BASE = "https://kitsu.io/api/edge"
 MANGADEX_BASE = "https://api.mangadex.org"
+MANGADEX_MAX_OFFSET = 10000  # MangaDex rejects offset + limit beyond this
+
+# Pages fetched concurrently per API
+FETCH_WORKERS = 8
+
+# Request rate limits per API (requests per second)
+ANILIST_RATE = 1.5  # 90 requests per minute
+KITSU_RATE = 5
+MANGADEX_RATE = 5
+
+
+class RateLimiter:
+    """Space out requests from any number of threads to a fixed rate."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+ANILIST_LIMITER = RateLimiter(ANILIST_RATE)
+KITSU_LIMITER = RateLimiter(KITSU_RATE)
+MANGADEX_LIMITER = RateLimiter(MANGADEX_RATE)
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that reuses connections and retries transient errors."""
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,  # AniList queries are POSTs
+    )
+    adapter = HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _create_session()
+
+
+def _request_json(method: str, url: str, label: str, limiter: RateLimiter, **kwargs: Any) -> Dict:
+    """Send a request and return the decoded JSON body, retrying until it succeeds."""
+    while True:
+        try:
+            limiter.wait()
+            response = SESSION.request(method, url, timeout=30, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except (requests.exceptions.RequestException, ValueError):
+            print(f"Retrying {label}...")
+            time.sleep(5)
+
+
+def _fetch_pages(fetch_page: Callable[[int], List[Dict]], offsets: range) -> List[Dict]:
+    """Fetch pages concurrently and concatenate them in offset order."""
+    results: List[Dict] = []
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        for page in executor.map(fetch_page, offsets):
+            results.extend(page)
+    return results
 
 
 # -----------------------------
@@ -40,18 +120,32 @@ query ($page: Int, $perPage: Int) {
 
 def fetch_anilist_page(page: int, per_page: int = 50) -> List[Dict]:
     """Fetch a single page of AniList media."""
-    while True:
-        try:
-            response = requests.post(
-                ANILIST_URL,
-                json={"query": ANILIST_QUERY, "variables": {"page": page, "perPage": per_page}},
-                timeout=30,
-            )
-            response.raise_for_status()
-            return response.json()["data"]["Page"]["media"]
-        except requests.exceptions.RequestException:
-            print(f"Retrying AniList page {page}...")
-            time.sleep(5)
+    response = _request_json(
+        "POST",
+        ANILIST_URL,
+        f"AniList page {page}",
+        ANILIST_LIMITER,
+        json={"query": ANILIST_QUERY, "variables": {"page": page, "perPage": per_page}},
+    )
+    return response["data"]["Page"]["media"]
+
+
+def fetch_anilist(per_page: int = 50) -> List[Dict]:
+    """Fetch all AniList media.
+
+    AniList does not report a total, so pages are requested in concurrent
+    windows until one of them comes back empty.
+    """
+    results: List[Dict] = []
+    page = 1
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        while True:
+            pages = range(page, page + FETCH_WORKERS)
+            for media_list in executor.map(lambda p: fetch_anilist_page(p, per_page), pages):
+                if not media_list:
+                    return results
+                results.extend(media_list)
+            page += FETCH_WORKERS
 
 
 def normalize_anilist(media: Dict) -> Dict:
@@ -80,21 +174,20 @@ def normalize_anilist(media: Dict) -> Dict:
 # -----------------------------
 # Kitsu
 # -----------------------------
-def fetch_kitsu(endpoint: str) -> List[Dict]:
-    """Fetch all media from Kitsu API endpoint."""
-    results = []
-    url = f"{KITSU_BASE}/{endpoint}?page[limit]=20"
-    while url:
-        try:
-            resp = requests.get(url).json()
-            results.extend(resp.get("data", []))
-            print(results)
-            url = resp.get("links", {}).get("next")
-            time.sleep(1)  # avoid rate limits
-        except requests.exceptions.RequestException:
-            print(f"Retrying Kitsu endpoint {endpoint}...")
-            time.sleep(5)
-    return results
+def fetch_kitsu(endpoint: str, limit: int = 20) -> List[Dict]:
+    """Fetch all media from Kitsu API endpoint.
+
+    The first page reports the total count; the remaining pages are then
+    fetched concurrently by offset.
+    """
+    def fetch_page(offset: int) -> List[Dict]:
+        url = f"{KITSU_BASE}/{endpoint}?page[limit]={limit}&page[offset]={offset}"
+        return _request_json("GET", url, f"Kitsu {endpoint} offset {offset}", KITSU_LIMITER).get("data", [])
+
+    first = _request_json("GET", f"{KITSU_BASE}/{endpoint}?page[limit]={limit}&page[offset]=0",
+                          f"Kitsu {endpoint} offset 0", KITSU_LIMITER)
+    total = first.get("meta", {}).get("count", 0)
+    return first.get("data", []) + _fetch_pages(fetch_page, range(limit, total, limit))
 
 
 def normalize_kitsu(media: Dict, media_type: str) -> Dict:
@@ -132,22 +225,19 @@ def normalize_kitsu(media: Dict, media_type: str) -> Dict:
 # MangaDex
 # -----------------------------
 def fetch_mangadex(limit: int = 100) -> List[Dict]:
-    """Fetch all manga from MangaDex API."""
-    mangas = []
-    offset = 0
-    while True:
-        try:
-            resp = requests.get(f"{MANGADEX_BASE}/manga?limit={limit}&offset={offset}").json()
-            data = resp.get("data", [])
-            if not data:
-                break
-            mangas.extend(data)
-            offset += limit
-            time.sleep(1)  # avoid rate limit
-        except requests.exceptions.RequestException:
-            print(f"Retrying MangaDex offset {offset}...")
-            time.sleep(5)
-    return mangas
+    """Fetch all manga from MangaDex API.
+
+    The first page reports the total count; the remaining pages are then
+    fetched concurrently by offset.
+    """
+    def fetch_page(offset: int) -> List[Dict]:
+        url = f"{MANGADEX_BASE}/manga?limit={limit}&offset={offset}"
+        return _request_json("GET", url, f"MangaDex offset {offset}", MANGADEX_LIMITER).get("data", [])
+
+    first = _request_json("GET", f"{MANGADEX_BASE}/manga?limit={limit}&offset=0", "MangaDex offset 0",
+                          MANGADEX_LIMITER)
+    total = min(first.get("total", 0), MANGADEX_MAX_OFFSET - limit + 1)
+    return first.get("data", []) + _fetch_pages(fetch_page, range(limit, total, limit))
 
 
 def normalize_mangadex(media: Dict) -> Dict:
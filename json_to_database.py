@@ -1,11 +1,22 @@
 """Load anime and manga JSON data into MongoDB."""
 
 import json
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict
-from db.mongo import get_collection, insert_documents, create_indexes
+from typing import Iterable, Iterator, List, Dict
+from db.mongo import get_collection, insert_documents, create_indexes, drop_indexes
 import config
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; without it the whole file is parsed at once
+    ijson = None
+
 
 def load_json_file(filepath: Path) -> List[Dict]:
     """Load JSON file into memory.
@@ -21,12 +32,96 @@ def load_json_file(filepath: Path) -> List[Dict]:
         json.JSONDecodeError: If the file contains invalid JSON.
     """
     try:
+        if orjson is not None:
+            with open(filepath, "rb") as file:
+                return orjson.loads(file.read())
         with open(filepath, "r", encoding="utf-8") as file:
             return json.load(file)
     except FileNotFoundError:
         raise FileNotFoundError(f"JSON file not found: {filepath}")
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in file {filepath}: {e}")
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+        raise json.JSONDecodeError(f"Invalid JSON in file {filepath}: {e.msg}", e.doc, e.pos)
+
+
+def iter_json_file(filepath: Path) -> Iterator[Dict]:
+    """Stream the documents of a JSON array file one at a time.
+
+    With ijson installed the array is parsed incrementally, so documents can
+    be inserted while the rest of the file is still being read. Otherwise
+    this falls back to :func:`load_json_file`.
+
+    Args:
+        filepath: Path to the JSON file.
+
+    Returns:
+        Iterator[Dict]: Documents from the JSON file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        json.JSONDecodeError: While iterating, if the file contains invalid JSON.
+    """
+    if ijson is None:
+        return iter(load_json_file(filepath))
+
+    try:
+        file = open(filepath, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON file not found: {filepath}")
+    return _stream_items(file, filepath)
+
+
+def _stream_items(file, filepath: Path) -> Iterator[Dict]:
+    """Yield the array items of an open JSON file, closing it when done."""
+    with file:
+        try:
+            # use_float keeps numbers as floats; Decimals cannot be stored in MongoDB
+            yield from ijson.items(file, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in file {filepath}: {e}", "", 0)
+
+
+# Fields every stored document has, with the default used when a source
+# leaves them out or null
+FIELD_DEFAULTS = {
+    "title_romaji": "",
+    "title_english": "",
+    "description": "",
+    "genres": [],
+    "tags": [],
+    "popularity": 0,
+    "average_score": 0,
+}
+
+
+def _normalize(doc: Dict) -> Dict:
+    """Fill missing or null fields with defaults of the right type.
+
+    Readers can then rely on every field being present. Numeric scores that
+    a source sends as strings (Kitsu ratings) are converted to numbers.
+
+    Args:
+        doc: Document to normalize in place.
+
+    Returns:
+        Dict: The same document.
+    """
+    for field, default in FIELD_DEFAULTS.items():
+        value = doc.get(field)
+        if value is None:
+            doc[field] = list(default) if isinstance(default, list) else default
+        elif isinstance(default, int) and isinstance(value, str):
+            try:
+                doc[field] = float(value)
+            except ValueError:
+                doc[field] = default
+    return doc
+
+
+def batched(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Group items into lists of at most size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 def main() -> None:
@@ -36,20 +131,32 @@ def main() -> None:
 
     print(f"Loading JSON file: {json_file}")
     try:
-        items = load_json_file(json_file)
+        batches = batched(map(_normalize, iter_json_file(json_file)), config.INSERT_BATCH_SIZE)
+        first_batch = next(batches, None)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error loading JSON: {e}")
         return
 
-    if not items:
+    if not first_batch:
         print("No items found in JSON file.")
         return
 
-    print(f"Loaded {len(items)} documents from JSON.")
-
     print("Inserting data into MongoDB...")
     try:
-        insert_documents(items)
+        # A fresh import loads faster without indexes; they are rebuilt below.
+        # Existing data keeps its unique id index so duplicates are skipped.
+        if get_collection().estimated_document_count() == 0:
+            drop_indexes()
+
+        # Batches are parsed and inserted in turn, never holding the whole file
+        total = 0
+        for batch in chain([first_batch], batches):
+            insert_documents(batch)
+            total += len(batch)
+            print(f"Inserted {total} documents...")
+    except json.JSONDecodeError as e:
+        print(f"Error loading JSON: {e}")
+        return
     except Exception as e:
         print(f"Error inserting documents: {e}")
         return
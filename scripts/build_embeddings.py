@@ -1,9 +1,10 @@
 """Build sentence embeddings for all documents in the database."""
 
-import pickle
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 from db.mongo import get_documents
-from engine.text_builder import build_text
+from engine.text_builder import build_texts
 import config
 
 
@@ -17,17 +18,27 @@ def main() -> None:
         return
 
     print(f"Building text representations for {len(docs)} documents...")
-    texts = [build_text(d) for d in docs]
+    texts = build_texts(docs)
 
     print("Loading sentence transformer model...")
     model = SentenceTransformer(config.SENTENCE_TRANSFORMER_MODEL)
+    if torch.cuda.is_available():
+        model = model.half().to("cuda")
 
     print("Generating embeddings...")
-    embeddings = model.encode(texts, show_progress_bar=True)
+    embeddings = model.encode(
+        texts,
+        batch_size=config.EMBEDDING_BATCH_SIZE,
+        show_progress_bar=True,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+
+    # float16 halves the file; build_index.py converts back to float32
+    embeddings = embeddings.astype("float16")
 
     print("Saving embeddings...")
-    with open(config.EMBEDDINGS_FILE, "wb") as f:
-        pickle.dump({"embeddings": embeddings}, f)
+    np.save(config.EMBEDDINGS_FILE, embeddings)
 
     print(f"Embeddings saved to {config.EMBEDDINGS_FILE}")
     print("Embeddings build complete!")
@@ -2,8 +2,12 @@
 
 import pytest
 from engine.text_builder import build_text
-from engine.hybrid_ranker import calculate_genre_overlap, normalize_values
+from engine.hybrid_ranker import (
+    calculate_genre_overlap, calculate_genre_overlap_mask, normalize_values, rank_candidates
+)
 from db.mongo import get_collection
+from db.title_cache import load_cached_titles, save_cached_titles
+import config
 
 
 def test_build_text():
@@ -39,6 +43,18 @@ def test_genre_overlap():
     assert calculate_genre_overlap(["Action"], []) == 0.0
 
 
+def test_genre_overlap_mask():
+    """Test genre overlap calculation on bitmasks."""
+    action, adventure, comedy, drama = 1, 2, 4, 8
+
+    overlap = calculate_genre_overlap_mask(action | adventure | comedy, action | adventure | drama)
+    assert overlap == 2/4  # same as the set version
+
+    # Empty genres
+    assert calculate_genre_overlap_mask(0, action) == 0.0
+    assert calculate_genre_overlap_mask(0, 0) == 0.0
+
+
 def test_normalize_values():
     """Test value normalization."""
     values = [1, 2, 3, 4, 5]
@@ -52,6 +68,51 @@ def test_normalize_values():
     assert len(normalize_values([])) == 0
 
 
+def test_rank_candidates_top_n():
+    """Test that the top-n ranking matches the full ranking cut to n."""
+    candidates = [
+        # Identical candidates tie on every score
+        {"doc": {"id": 0}, "semantic": 0.9, "genres": ["Action"], "popularity": 100, "rating": 80},
+        {"doc": {"id": 1}, "semantic": 0.9, "genres": ["Action"], "popularity": 100, "rating": 80},
+        {"doc": {"id": 2}, "semantic": 0.5, "genres": ["Drama"], "popularity": None, "rating": None},
+        {"doc": {"id": 3}, "semantic": 0.7, "genres": [], "popularity": 50, "rating": None},
+        {"doc": {"id": 4}, "semantic": 0.9, "genres": ["Action"], "popularity": 100, "rating": 80},
+        {"doc": {"id": 5}, "semantic": 0.2, "genres": ["Action", "Drama"], "popularity": None, "rating": 90},
+    ]
+    reference_genres = ["Action", "Comedy"]
+
+    full = rank_candidates(candidates, reference_genres)
+    assert len(full) == len(candidates)
+
+    for n in (0, 1, 2, 3, len(candidates), len(candidates) + 5):
+        assert rank_candidates(candidates, reference_genres, n) == full[:n]
+
+    # Many tied candidates straddling the cutoff
+    tied = [
+        {"doc": {"id": i}, "semantic": 0.5 if i % 3 else 0.8, "genres": ["Action"],
+         "popularity": None, "rating": None}
+        for i in range(50)
+    ]
+    full = rank_candidates(tied, reference_genres)
+    for n in range(len(tied) + 1):
+        assert rank_candidates(tied, reference_genres, n) == full[:n]
+
+
+def test_title_cache(tmp_path, monkeypatch):
+    """Test title cache round trip and expiry."""
+    monkeypatch.setattr(config, "TITLES_CACHE_FILE", tmp_path / "titles.json")
+
+    assert load_cached_titles() is None  # no cache yet
+
+    titles = ["Naruto", "Shingeki no Kyojin"]
+    assert save_cached_titles(titles) == titles
+    assert load_cached_titles() == titles
+
+    # Stale cache is ignored
+    monkeypatch.setattr(config, "TITLES_CACHE_TTL", -1)
+    assert load_cached_titles() is None
+
+
 def test_mongo_connection():
     """Test MongoDB connection (requires running MongoDB)."""
     try: